@@ -9,6 +9,10 @@ from typing import Optional, Tuple
 import requests
 from tqdm import tqdm
 
+# Read/write size for audio downloads; large enough to amortize per-chunk
+# Python overhead while keeping peak memory to a single chunk
+DOWNLOAD_CHUNK_SIZE = 128 * 1024
+
 
 # RSS Download Functions
 def download_rss_from_url(rss_url: str) -> Optional[bytes]:
@@ -60,7 +64,7 @@ def download_file_to_path(
     """Download file from URL to specific path."""
     logger = logging.getLogger(__name__)
 
-    if os.path.exists(output_path):
+    if os.path.isfile(output_path):
         logger.debug("File already exists: %s. Skipping.", output_path)
         return output_path, False
 
@@ -74,7 +78,9 @@ def download_file_to_path(
             content_length = int(response.headers.get("content-length", 0))
             logger.debug("Content length: %d bytes", content_length)
 
-            with open(output_path, "wb") as output_file:
+            with open(
+                output_path, "wb", buffering=DOWNLOAD_CHUNK_SIZE
+            ) as output_file:
                 # Show download progress
                 with tqdm(
                     total=content_length,
@@ -83,7 +89,9 @@ def download_file_to_path(
                     desc=output_filename,
                     leave=False,
                 ) as progress_bar:
-                    for chunk in response.iter_content(chunk_size=8192):
+                    for chunk in response.iter_content(
+                        chunk_size=DOWNLOAD_CHUNK_SIZE
+                    ):
                         if chunk:  # Filter out keep-alive chunks
                             output_file.write(chunk)
                             progress_bar.update(len(chunk))
@@ -92,7 +100,7 @@ def download_file_to_path(
         return output_path, True
     except (requests.exceptions.RequestException, IOError) as e:
         logger.error("Download failed for %s: %s", output_filename, e)
-        if os.path.exists(output_path):
+        if os.path.isfile(output_path):
             os.remove(output_path)  # Clean up partial file
             logger.debug("Cleaned up partial file: %s", output_path)
         return None, False
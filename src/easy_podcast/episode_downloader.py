@@ -69,7 +69,7 @@ class EpisodeDownloader:
     ) -> DownloadResult:
         """Download single episode to target path."""
         # Check if file already exists
-        if self.storage.file_exists(target_path):
+        if self.storage.is_file(target_path):
             self.logger.debug("Episode already exists: %s", target_path)
             return DownloadResult(
                 success=True, file_path=target_path, was_cached=True
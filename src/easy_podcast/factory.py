@@ -6,6 +6,7 @@ clearly.
 """
 
 import logging
+from dataclasses import replace
 from typing import Optional
 
 from .downloader import download_rss_from_url
@@ -44,9 +45,15 @@ def _create_manager(
 
 
 def create_manager_from_rss(
-    rss_url: str, data_dir: str = "./data"
+    rss_url: str,
+    data_dir: str = "./data",
+    repository: Optional[PodcastRepository] = None,
 ) -> Optional[PodcastManager]:
-    """Create PodcastManager by downloading and parsing RSS feed."""
+    """Create PodcastManager by downloading and parsing RSS feed.
+
+    An existing ``repository`` may be passed in to persist through it
+    instead of one built over ``data_dir``.
+    """
     logger = logging.getLogger(__name__)
     logger.info("Creating PodcastManager from RSS URL: %s", rss_url)
 
@@ -64,16 +71,14 @@ def create_manager_from_rss(
         return None
 
     # Create dependencies
-    _storage, repository, downloader = _create_dependencies(data_dir)
-
-    # Save podcast metadata
-    repository.save_podcast_metadata(podcast)
-
-    # Save episodes
-    repository.save_episodes(podcast.guid, podcast.episodes)
+    if repository is None:
+        _storage, repository, downloader = _create_dependencies(data_dir)
+    else:
+        downloader = EpisodeDownloader(repository.storage, repository)
 
-    # Save RSS cache
-    repository.save_rss_cache(podcast.guid, rss_content)
+    # Save podcast metadata, episodes and RSS cache together
+    if not repository.commit_podcast(podcast, rss_content):
+        logger.warning("Failed to save some data for podcast %s", podcast.guid)
 
     # Create and return manager
     return _create_manager(podcast, repository, downloader)
@@ -97,7 +102,7 @@ def create_manager_from_storage(
 
     # Load episodes
     episodes = repository.load_episodes(podcast_guid)
-    podcast.episodes = episodes
+    podcast = replace(podcast, episodes=episodes)
 
     # Create and return manager
     return _create_manager(podcast, repository, downloader)
@@ -27,6 +27,9 @@ class PodcastManager:
         self.podcast = podcast
         self.repository = repository
         self.downloader = downloader
+        # Episode file paths keyed by (podcast guid, episode id, file spec);
+        # the guid is part of the key because ``podcast`` can be reassigned
+        self._episode_paths: dict[tuple[str, str, FileSpec], str] = {}
 
         self.logger.info(
             "Initializing PodcastManager for podcast: '%s'", self.podcast.title
@@ -55,9 +58,14 @@ class PodcastManager:
         self, episode: Episode, file_spec: FileSpec
     ) -> str:
         """Get the full path to an episode file of the specified type."""
-        return self.repository.get_episode_file_path(
-            self.podcast.guid, episode, file_spec
-        )
+        key = (self.podcast.guid, episode.id, file_spec)
+        path = self._episode_paths.get(key)
+        if path is None:
+            path = self.repository.get_episode_file_path(
+                self.podcast.guid, episode, file_spec
+            )
+            self._episode_paths[key] = path
+        return path
 
     def get_new_episodes(self) -> List[Episode]:
         """Get episodes that haven't been downloaded yet."""
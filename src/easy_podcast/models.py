@@ -4,7 +4,7 @@ Data models for podcast episodes and podcasts.
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from typing import Any, Protocol, Union
 
@@ -53,7 +53,10 @@ class PodcastFiles:
 class Storable(Protocol):
     """Protocol for entities that can be stored with GUID-based operations."""
 
-    guid: str
+    @property
+    def guid(self) -> str:
+        """Stable identifier; read-only so frozen dataclasses conform."""
+        ...  # pylint: disable=unnecessary-ellipsis
 
     def to_json(self) -> dict[str, Any]:
         """Convert entity to JSON-serializable dictionary."""
@@ -65,7 +68,7 @@ class Storable(Protocol):
         ...  # pylint: disable=unnecessary-ellipsis
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Episode:  # pylint: disable=too-many-instance-attributes
     """Represents a single podcast episode.
 
@@ -106,10 +109,15 @@ class Episode:  # pylint: disable=too-many-instance-attributes
 
     def to_json(self) -> dict[str, Any]:
         """Convert episode to JSON-serializable dictionary."""
-        return asdict(self)
+        # All fields are primitives, so a shallow dict avoids asdict's
+        # recursive copy
+        return {name: getattr(self, name) for name in _EPISODE_FIELDS}
+
+
+_EPISODE_FIELDS = tuple(f.name for f in fields(Episode))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Podcast:
     """Represents a podcast, containing its metadata and episodes.
 
@@ -136,4 +144,16 @@ class Podcast:
 
     def to_json(self) -> dict[str, Any]:
         """Convert podcast to JSON-serializable dictionary."""
-        return asdict(self)
+        data = {name: getattr(self, name) for name in _PODCAST_FIELDS}
+        data["episodes"] = [episode.to_json() for episode in self.episodes]
+        return data
+
+    def metadata_to_json(self) -> dict[str, Any]:
+        """Convert podcast to a dictionary without its episodes."""
+        return {name: getattr(self, name) for name in _METADATA_FIELDS}
+
+
+_PODCAST_FIELDS = tuple(f.name for f in fields(Podcast))
+_METADATA_FIELDS = tuple(
+    name for name in _PODCAST_FIELDS if name != "episodes"
+)
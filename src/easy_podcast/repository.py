@@ -4,9 +4,17 @@ Domain-specific repository for podcast data persistence.
 This module handles podcast and episode storage using the Storage layer.
 """
 
-import json
-from dataclasses import asdict
-from typing import List, Optional, TypeVar, Generic, Set, Type
+import asyncio
+from typing import (
+    Any,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Type,
+    TypeVar,
+)
 
 from .models import (
     Episode,
@@ -30,26 +38,33 @@ class Repository(Generic[T]):
 
     def save(self, entities: List[T], file_path: str) -> bool:
         """Save entities to JSONL file."""
-        lines = [entity.to_json() for entity in entities]
-        return self.storage.write_text_lines(file_path, lines)
+        return self.storage.write_jsonl(file_path, self._to_records(entities))
+
+    def append(self, entities: List[T], file_path: str) -> bool:
+        """Append entities to the end of a JSONL file."""
+        return self.storage.append_jsonl(file_path, self._to_records(entities))
+
+    def _to_records(self, entities: List[T]) -> Iterator[dict[str, Any]]:
+        """Yield the JSON-serializable form of each entity."""
+        for entity in entities:
+            yield entity.to_json()
 
     def load(self, file_path: str, entity_class: Type[T]) -> List[T]:
         """Load entities from JSONL file."""
-        lines = self.storage.read_text_lines(file_path)
-        if not lines:
+        records = self.storage.read_jsonl(file_path)
+        if not records:
             return []
 
         entities: List[T] = []
-        for line in lines:
-            if not line.strip():
+        for entity_data in records:
+            if not isinstance(entity_data, dict):
                 continue
 
             try:
-                entity_data = json.loads(line)
                 entity = entity_class.from_dict(entity_data)
                 # Type ignore needed for protocol type issues
                 entities.append(entity)  # type: ignore[arg-type]
-            except (json.JSONDecodeError, KeyError, TypeError):
+            except (KeyError, TypeError):
                 continue
 
         return entities
@@ -104,29 +119,46 @@ class Repository(Generic[T]):
 class PodcastRepository:
     """Repository for podcast-specific data operations."""
 
+    __slots__ = (
+        "storage",
+        "episode_repository",
+        "podcast_repository",
+        "_join",
+        "_base",
+        "_episodes_cache",
+        "_podcast_cache",
+    )
+
     def __init__(self, storage: Storage):
         """Initialize with storage instance."""
         self.storage = storage
         self.episode_repository = Repository[Episode](storage)
         self.podcast_repository = Repository[Podcast](storage)
+        # Bound once; path helpers run per episode on hot paths
+        self._join = storage.join_path
+        self._base = storage.base_dir
+        # Parsed file contents keyed by path, valid while the file's
+        # (mtime_ns, size) signature is unchanged
+        self._episodes_cache: dict[
+            str, tuple[tuple[int, int], List[Episode]]
+        ] = {}
+        self._podcast_cache: dict[
+            str, tuple[tuple[int, int], dict[str, Any]]
+        ] = {}
 
     def get_podcast_dir(self, podcast_guid: str) -> str:
         """Get podcast directory path using GUID to prevent collisions."""
-        return self.storage.join_path(self.storage.base_dir, podcast_guid)
+        return self._join(self._base, podcast_guid)
 
     def get_episode_file_path(
         self, podcast_guid: str, episode: Episode, file_spec: FileSpec
     ) -> str:
         """Get full path to an episode file of the specified type."""
-        podcast_dir = self.get_podcast_dir(podcast_guid)
-
-        if hasattr(file_spec, "suffix"):  # EpisodeFile enum
-            suffix = file_spec.suffix
-        else:  # CustomFile
-            suffix = file_spec.suffix
-
-        filename = f"{episode.id}{suffix}"
-        return self.storage.join_path(podcast_dir, filename)
+        # Both EpisodeFile and CustomFile expose ``suffix``
+        return self._join(
+            self.get_podcast_dir(podcast_guid),
+            f"{episode.id}{file_spec.suffix}",
+        )
 
     def ensure_podcast_dir_exists(self, podcast_guid: str) -> str:
         """Ensure podcast directory exists and return its path."""
@@ -136,20 +168,43 @@ class PodcastRepository:
 
     def save_podcast_metadata(self, podcast: Podcast) -> bool:
         """Save podcast metadata to JSON file."""
-        self.ensure_podcast_dir_exists(podcast.guid)
         metadata_path = self._get_podcast_metadata_path(podcast.guid)
+        self._podcast_cache.pop(metadata_path, None)
 
-        # Save podcast without episodes (episodes saved separately)
-        podcast_data = asdict(podcast)
-        podcast_data.pop("episodes", None)
+        # Episodes are saved separately, in episodes.jsonl
+        return self.storage.write_json(
+            metadata_path, podcast.metadata_to_json()
+        )
 
-        return self.storage.write_json(metadata_path, podcast_data)
+    def commit_podcast(self, podcast: Podcast, rss_content: bytes) -> bool:
+        """Save podcast metadata, episodes and RSS cache.
+
+        Each file is replaced atomically on its own; the three writes are
+        not atomic as a group, and a failed one does not undo the others.
+        The podcast and data directories are then synced once, a single
+        durability barrier for all renames instead of one per file.
+        """
+        results = [
+            self.save_podcast_metadata(podcast),
+            self.save_episodes(podcast.guid, podcast.episodes),
+            self.save_rss_cache(podcast.guid, rss_content),
+        ]
+        self.storage.sync_directory(self.get_podcast_dir(podcast.guid))
+        self.storage.sync_directory(self._base)
+        return all(results)
 
     def load_podcast_metadata(self, podcast_guid: str) -> Optional[Podcast]:
         """Load podcast metadata from JSON file."""
         metadata_path = self._get_podcast_metadata_path(podcast_guid)
 
-        data = self.storage.read_json(metadata_path)
+        signature = self.storage.file_signature(metadata_path)
+        cached = self._podcast_cache.get(metadata_path)
+        if signature is not None and cached and cached[0] == signature:
+            data: Optional[dict[str, Any]] = cached[1]
+        else:
+            data = self.storage.read_json(metadata_path)
+            if data and signature is not None:
+                self._podcast_cache[metadata_path] = (signature, data)
         if not data:
             return None
 
@@ -162,14 +217,26 @@ class PodcastRepository:
         self, podcast_guid: str, episodes: List[Episode]
     ) -> bool:
         """Save all episodes to a single JSONL file."""
-        self.ensure_podcast_dir_exists(podcast_guid)
         episodes_path = self._get_episodes_file_path(podcast_guid)
+        self._episodes_cache.pop(episodes_path, None)
         return self.episode_repository.save(episodes, episodes_path)
 
     def load_episodes(self, podcast_guid: str) -> List[Episode]:
-        """Load all episodes from JSONL file."""
+        """Load all episodes from JSONL file.
+
+        Parsed episodes are cached until the file's mtime or size changes,
+        so repeated loads of an unchanged podcast skip the JSON parse.
+        """
         episodes_path = self._get_episodes_file_path(podcast_guid)
-        return self.episode_repository.load(episodes_path, Episode)
+        signature = self.storage.file_signature(episodes_path)
+        cached = self._episodes_cache.get(episodes_path)
+        if signature is not None and cached and cached[0] == signature:
+            return list(cached[1])
+
+        episodes = self.episode_repository.load(episodes_path, Episode)
+        if signature is not None:
+            self._episodes_cache[episodes_path] = (signature, episodes)
+        return list(episodes)
 
     def upsert_episodes(
         self, podcast_guid: str, new_episodes: List[Episode]
@@ -179,24 +246,32 @@ class PodcastRepository:
         updated_episodes, newly_added = self.episode_repository.upsert(
             existing_episodes, new_episodes
         )
-        self.save_episodes(podcast_guid, updated_episodes)
+        # Existing entries never change during upsert, so only the new
+        # episodes need to reach disk
+        if newly_added:
+            episodes_path = self._get_episodes_file_path(podcast_guid)
+            self._episodes_cache.pop(episodes_path, None)
+            self.episode_repository.append(newly_added, episodes_path)
         return updated_episodes, newly_added
 
     def filter_new_episodes(
         self, podcast_guid: str, episodes: List[Episode]
     ) -> List[Episode]:
-        """Filter episodes that don't have audio files downloaded yet."""
+        """Filter episodes that don't have audio files downloaded yet.
+
+        The podcast directory is listed once and episodes are matched by
+        file name, instead of stat()ing one path per episode.
+        """
+        existing = self.storage.list_files(self.get_podcast_dir(podcast_guid))
+        suffix = EpisodeFile.AUDIO.suffix
         return [
             episode
             for episode in episodes
-            if not self.episode_file_exists(
-                podcast_guid, episode, EpisodeFile.AUDIO
-            )
+            if f"{episode.id}{suffix}" not in existing
         ]
 
     def save_rss_cache(self, podcast_guid: str, rss_content: bytes) -> bool:
         """Save RSS content to cache file."""
-        self.ensure_podcast_dir_exists(podcast_guid)
         cache_path = self._get_rss_cache_path(podcast_guid)
         return self.storage.write_bytes(cache_path, rss_content)
 
@@ -205,9 +280,27 @@ class PodcastRepository:
         cache_path = self._get_rss_cache_path(podcast_guid)
         return self.storage.read_bytes(cache_path)
 
+    async def save_rss_cache_async(
+        self, podcast_guid: str, rss_content: bytes
+    ) -> bool:
+        """Save RSS content to cache file without blocking the event loop."""
+        cache_path = self._get_rss_cache_path(podcast_guid)
+        return await asyncio.to_thread(
+            self.storage.write_bytes, cache_path, rss_content
+        )
+
+    async def load_rss_cache_async(self, podcast_guid: str) -> Optional[bytes]:
+        """Load RSS content from cache file without blocking the event loop.
+
+        The read runs in the default thread pool, so caches for several
+        podcasts can be loaded concurrently with ``asyncio.gather``.
+        """
+        cache_path = self._get_rss_cache_path(podcast_guid)
+        return await asyncio.to_thread(self.storage.read_bytes, cache_path)
+
     def list_podcast_directories(self) -> List[str]:
         """List all podcast directories in the data directory."""
-        return self.storage.list_directories(self.storage.base_dir)
+        return self.storage.list_directories(self._base)
 
     def podcast_exists(self, podcast_guid: str) -> bool:
         """Check if a podcast directory exists."""
@@ -221,19 +314,19 @@ class PodcastRepository:
         file_path = self.get_episode_file_path(
             podcast_guid, episode, file_spec
         )
-        return self.storage.file_exists(file_path)
+        return self.storage.is_file(file_path)
 
     def _get_podcast_metadata_path(self, podcast_guid: str) -> str:
         """Get path to podcast metadata file."""
         podcast_dir = self.get_podcast_dir(podcast_guid)
-        return self.storage.join_path(podcast_dir, PodcastFiles.METADATA)
+        return self._join(podcast_dir, PodcastFiles.METADATA)
 
     def _get_episodes_file_path(self, podcast_guid: str) -> str:
         """Get path to episodes.jsonl file for a podcast."""
         podcast_dir = self.get_podcast_dir(podcast_guid)
-        return self.storage.join_path(podcast_dir, PodcastFiles.EPISODES)
+        return self._join(podcast_dir, PodcastFiles.EPISODES)
 
     def _get_rss_cache_path(self, podcast_guid: str) -> str:
         """Get path to RSS cache file."""
         podcast_dir = self.get_podcast_dir(podcast_guid)
-        return self.storage.join_path(podcast_dir, PodcastFiles.RSS_CACHE)
+        return self._join(podcast_dir, PodcastFiles.RSS_CACHE)
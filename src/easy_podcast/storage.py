@@ -4,9 +4,65 @@ Pure storage layer for file operations.
 This module provides low-level file operations without any business logic.
 """
 
+import importlib
 import json
 import os
-from typing import Any, Optional, cast
+import tempfile
+from contextlib import contextmanager, suppress
+from types import ModuleType
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+    cast,
+)
+
+# orjson is an optional speedup (the ``fast`` extra); imported by name so
+# type checking does not depend on whether it is installed
+_orjson: Optional[ModuleType]
+try:
+    _orjson = importlib.import_module("orjson")
+except ImportError:
+    _orjson = None
+
+_T = TypeVar("_T")
+
+
+def _default_file_mode() -> int:
+    """Get the mode open() would give a new file under the process umask."""
+    # os.umask can only be read by setting it; do it once, at import time,
+    # as it would briefly affect files created by other threads
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# mkstemp creates files as 0600; give replaced files the usual mode
+_FILE_MODE = _default_file_mode()
+
+# Reused by the stdlib fallback; json.dumps with non-default options
+# would build a new encoder per call
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON, preferring orjson."""
+    if _orjson is not None:
+        return cast(
+            bytes, _orjson.dumps(data, option=_orjson.OPT_NON_STR_KEYS)
+        )
+    return _ENCODER.encode(data).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, preferring orjson."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
 
 
 class Storage:
@@ -15,39 +71,171 @@ class Storage:
     def __init__(self, base_dir: str = "./data"):
         """Initialize with base directory."""
         self.base_dir = base_dir
+        # Directories already created or found, so repeated writes into
+        # the same directory skip the makedirs stat/mkdir chain
+        self._known_dirs: set[str] = set()
 
     def ensure_directory(self, path: str) -> None:
         """Create directory if it doesn't exist."""
         os.makedirs(path, exist_ok=True)
+        self._known_dirs.add(path)
+
+    def _ensure_parent(self, path: str) -> None:
+        """Create the parent directory of a file about to be written.
+
+        Parents already ensured by this instance are skipped; if one was
+        removed since, ``_retry_in_parent`` recreates it on the write.
+        """
+        directory = os.path.dirname(path)
+        if directory and directory not in self._known_dirs:
+            self.ensure_directory(directory)
+
+    def _retry_in_parent(self, path: str, opener: Callable[[], _T]) -> _T:
+        """Run ``opener`` to create ``path``.
+
+        If a remembered parent directory was removed since it was created,
+        forget it, create it again and retry once.
+        """
+        try:
+            return opener()
+        except FileNotFoundError:
+            directory = os.path.dirname(path)
+            if directory not in self._known_dirs:
+                raise
+            self._known_dirs.discard(directory)
+            self.ensure_directory(directory)
+            return opener()
+
+    def _open_for_write(self, path: str, mode: str) -> IO[Any]:
+        """Open a file object for writing."""
+        encoding = None if "b" in mode else "utf-8"
+        return self._retry_in_parent(
+            path,
+            # pylint: disable-next=consider-using-with
+            lambda: open(path, mode, encoding=encoding),
+        )
+
+    def _make_temp(self, path: str) -> tuple[int, str]:
+        """Create a unique temp file next to ``path``.
+
+        Each write gets its own file, so concurrent writers of the same
+        path cannot truncate or interleave with each other's data.
+        """
+        fd, tmp_path = self._retry_in_parent(
+            path,
+            lambda: tempfile.mkstemp(
+                # Same directory as the target, so os.replace never has
+                # to cross filesystems
+                dir=os.path.dirname(path) or os.curdir,
+                prefix=os.path.basename(path) + ".",
+            ),
+        )
+        try:
+            os.chmod(tmp_path, _FILE_MODE)
+        except OSError:
+            os.close(fd)
+            os.remove(tmp_path)
+            raise
+        return fd, tmp_path
+
+    @contextmanager
+    def _atomic_open(self, path: str, mode: str) -> Iterator[IO[Any]]:
+        """Open a temp file that replaces ``path`` once fully written.
+
+        The data is fsynced before the rename, so a crash leaves either the
+        old file or the complete new one, never a truncated file.
+        """
+        fd, tmp_path = self._make_temp(path)
+        encoding = None if "b" in mode else "utf-8"
+        try:
+            with os.fdopen(fd, mode, encoding=encoding) as f:
+                yield f
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            with suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+    def _atomic_write_bytes(self, path: str, data: bytes) -> None:
+        """Atomically replace ``path`` with ``data``.
+
+        Writes go straight to the file descriptor: for a payload that is
+        already encoded, the buffered/text IO stack only adds overhead.
+        """
+        fd, tmp_path = self._make_temp(path)
+        try:
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view) :]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, path)
+        except BaseException:
+            with suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+    def sync_directory(self, path: str) -> None:
+        """Flush a directory's entries, such as completed renames, to disk.
+
+        Best effort: platforms that cannot fsync a directory skip it.
+        """
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
 
     def file_exists(self, path: str) -> bool:
         """Check if file exists."""
         return os.path.exists(path)
 
-    def read_json(self, path: str) -> Optional[dict[str, Any]]:
-        """Read JSON file, return None if file doesn't exist or is invalid."""
-        if not os.path.exists(path):
+    def is_file(self, path: str) -> bool:
+        """Check if path is a regular file, following symlinks.
+
+        This is the same rule list_files applies, so a name it lists and a
+        path this accepts always agree.
+        """
+        return os.path.isfile(path)
+
+    def file_signature(self, path: str) -> Optional[tuple[int, int]]:
+        """Return (mtime_ns, size) for a file, or None if it is missing."""
+        try:
+            stat = os.stat(path)
+        except OSError:
             return None
+        return stat.st_mtime_ns, stat.st_size
 
+    def read_json(self, path: str) -> Optional[dict[str, Any]]:
+        """Read JSON file, return None if file doesn't exist or is invalid."""
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    return cast(dict[str, Any], data)
-                return None
-        except (json.JSONDecodeError, FileNotFoundError, IOError):
+            # One read of the whole (small) file, parsed straight from bytes
+            with open(path, "rb") as f:
+                data = _loads(f.read())
+            if isinstance(data, dict):
+                return cast(dict[str, Any], data)
+            return None
+        except (ValueError, FileNotFoundError, IOError):
+            # ValueError covers JSON decode errors and invalid UTF-8
             return None
 
     def write_json(self, path: str, data: dict[str, Any]) -> bool:
         """Write data to JSON file, return success status."""
         try:
-            # Ensure directory exists
-            directory = os.path.dirname(path)
-            if directory:
-                self.ensure_directory(directory)
+            self._ensure_parent(path)
 
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Serialize up front so the file sees one write, not one per
+            # encoder token
+            self._atomic_write_bytes(path, _dumps(data))
             return True
         except (IOError, TypeError):
             return False
@@ -63,56 +251,105 @@ class Storage:
     def write_bytes(self, path: str, data: bytes) -> bool:
         """Write bytes to file, return success status."""
         try:
-            # Ensure directory exists
-            directory = os.path.dirname(path)
-            if directory:
-                self.ensure_directory(directory)
+            self._ensure_parent(path)
 
-            with open(path, "wb") as f:
-                f.write(data)
+            self._atomic_write_bytes(path, data)
             return True
         except IOError:
             return False
 
     def write_text_lines(self, path: str, lines: list[dict[str, Any]]) -> bool:
         """Write lines to text file (for JSONL), return success status."""
+        return self.write_jsonl(path, lines)
+
+    def write_jsonl(self, path: str, records: Iterable[Any]) -> bool:
+        """Write one compact JSON document per line, replacing the file.
+
+        Records are consumed lazily so callers can pass a generator without
+        building the whole file contents in memory first.
+        """
         try:
-            # Ensure directory exists
-            directory = os.path.dirname(path)
-            if directory:
-                self.ensure_directory(directory)
+            self._ensure_parent(path)
 
-            with open(path, "w", encoding="utf-8") as f:
-                for line in lines:
-                    f.write(json.dumps(line) + "\n")
+            with self._atomic_open(path, "wb") as f:
+                f.writelines(_dumps(record) + b"\n" for record in records)
             return True
-        except IOError:
+        except (IOError, TypeError):
             return False
 
-    def read_text_lines(self, path: str) -> Optional[list[str]]:
-        """Read lines from text file, return None if error."""
-        if not os.path.exists(path):
+    def append_jsonl(self, path: str, records: Iterable[Any]) -> bool:
+        """Append one compact JSON document per line, creating the file.
+
+        Only the new lines are written, so adding to a large JSONL file
+        costs O(new lines) instead of rewriting the whole file. If an
+        earlier append was cut short, its partial line is terminated first
+        so the new records are not merged into it.
+        """
+        try:
+            self._ensure_parent(path)
+
+            # Serialize first so a bad record cannot leave a partial line
+            data = b"".join(_dumps(record) + b"\n" for record in records)
+            with self._open_for_write(path, "a+b") as f:
+                end = f.seek(0, os.SEEK_END)
+                if end:
+                    f.seek(end - 1)
+                    if f.read(1) != b"\n":
+                        data = b"\n" + data
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            return True
+        except (IOError, TypeError):
+            return False
+
+    def read_jsonl(self, path: str) -> Optional[list[Any]]:
+        """Read a JSONL file, skipping blank and malformed lines.
+
+        Returns None if the file doesn't exist or can't be read.
+        """
+        try:
+            with open(path, "rb") as f:
+                lines = f.read().splitlines()
+        except (FileNotFoundError, IOError):
             return None
 
+        records: list[Any] = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                records.append(_loads(line))
+            except ValueError:
+                # Covers JSON decode errors and invalid UTF-8
+                continue
+        return records
+
+    def read_text_lines(self, path: str) -> Optional[list[str]]:
+        """Read lines from text file, return None if error."""
         try:
             with open(path, "r", encoding="utf-8") as f:
-                return [line.strip() for line in f.readlines()]
+                return f.read().splitlines()
         except (FileNotFoundError, IOError):
             return None
 
     def list_directories(self, path: str) -> list[str]:
         """List subdirectories in given path."""
-        if not os.path.exists(path):
+        try:
+            # DirEntry carries the file type from the directory read, so
+            # is_dir() usually needs no extra stat() per entry
+            with os.scandir(path) as entries:
+                return [entry.name for entry in entries if entry.is_dir()]
+        except OSError:
             return []
 
+    def list_files(self, path: str) -> set[str]:
+        """List names of regular files in given path."""
         try:
-            return [
-                item
-                for item in os.listdir(path)
-                if os.path.isdir(os.path.join(path, item))
-            ]
+            with os.scandir(path) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
         except OSError:
-            return []
+            return set()
 
     def join_path(self, *parts: str) -> str:
         """Join path parts."""
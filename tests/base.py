@@ -2,63 +2,110 @@
 
 # pylint: disable=duplicate-code
 
+import copy
+import functools
 import os
 import shutil
 import tempfile
 import unittest
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from unittest.mock import Mock
 
+try:
+    # libxml2-backed serializer when available; the API used below is
+    # shared with the standard library fallback
+    from lxml import etree as ET
+except ImportError:
+    from xml.etree import ElementTree as ET  # type: ignore[no-redef]
+
 from easy_podcast.episode_downloader import EpisodeDownloader
 from easy_podcast.manager import PodcastManager
 from easy_podcast.models import Podcast
 from easy_podcast.repository import PodcastRepository
 from easy_podcast.storage import Storage
 
+# RAM-backed parent for test directories where the platform has one, so
+# fixture writes and stats never touch the disk
+TEST_TMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+# Feed skeleton built once and deep-copied per render
+_RSS_TEMPLATE = ET.Element("rss", version="2.0")
+ET.SubElement(ET.SubElement(_RSS_TEMPLATE, "channel"), "title")
+
+
+@functools.lru_cache(maxsize=64)
+def _render_mock_rss(
+    episodes_data: Tuple[Tuple[Tuple[str, Any], ...], ...], title: str
+) -> bytes:
+    """Render mock RSS bytes; cached since the output is immutable."""
+    root = copy.deepcopy(_RSS_TEMPLATE)
+    channel = root[0]
+    channel[0].text = title
+    for episode_items in episodes_data:
+        episode = dict(episode_items)
+        item = ET.SubElement(channel, "item")
+        ET.SubElement(item, "title").text = str(
+            episode.get("title", "Test Episode")
+        )
+        ET.SubElement(item, "supercast_episode_id").text = str(
+            episode.get("supercast_episode_id", "123")
+        )
+        ET.SubElement(
+            item,
+            "enclosure",
+            url=str(episode.get("audio_link", "http://test.com/test.mp3")),
+            type="audio/mpeg",
+            length=str(episode.get("size", 1000)),
+        )
+    # Annotated so the result is bytes with or without lxml-stubs
+    content: bytes = ET.tostring(root, encoding="utf-8", xml_declaration=True)
+    return content
+
 
 class PodcastTestBase(unittest.TestCase):
     """Base test class providing common setup/teardown and utilities."""
 
+    _root: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create one temporary root directory for the whole class."""
+        super().setUpClass()
+        cls._root = tempfile.mkdtemp(prefix="podcast_test_", dir=TEST_TMP_ROOT)
+        # Removed once per class instead of once per test
+        cls.addClassCleanup(shutil.rmtree, cls._root, ignore_errors=True)
+
     def setUp(self) -> None:
         """Set up temporary test directory and configure environment."""
-        # Use tempfile for better isolation and automatic cleanup
-        self.test_dir = tempfile.mkdtemp(prefix="podcast_test_")
+        # Each run of a test gets a fresh directory under the class root,
+        # so reruns of the same method never collide
+        self.test_dir = tempfile.mkdtemp(
+            prefix=f"{self._testMethodName}_", dir=self._root
+        )
 
         # Set environment variable for centralized path management
         os.environ["PODCAST_DATA_DIRECTORY"] = self.test_dir
 
-    def tearDown(self) -> None:
-        """Clean up test directory."""
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
-
+    @staticmethod
+    def _touch(path: str, content: bytes = b"dummy content") -> None:
+        """Write a small fixture file with raw os calls, skipping io."""
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, content)
+        finally:
+            os.close(fd)
+
+    @classmethod
     def create_mock_rss_content(
-        self, episodes_data: List[Dict[str, Any]], title: str = "Test Podcast"
+        cls, episodes_data: List[Dict[str, Any]], title: str = "Test Podcast"
     ) -> bytes:
         """Generate mock RSS content for testing."""
-        items = ""
-        for episode in episodes_data:
-            items += f"""
-            <item>
-                <title>{episode.get("title", "Test Episode")}</title>
-                <supercast_episode_id>
-                    {episode.get("supercast_episode_id", "123")}
-                </supercast_episode_id>
-                <enclosure
-                    url="{episode.get("audio_link",
-                                      "http://test.com/test.mp3")}"
-                    type="audio/mpeg"
-                    length="{episode.get("size", 1000)}"/>
-            </item>"""
-
-        rss_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-        <rss version="2.0">
-            <channel>
-                <title>{title}</title>
-                {items}
-            </channel>
-        </rss>"""
-        return rss_content.encode("utf-8")
+        # Freeze the episode dicts so identical feeds hit the render cache
+        frozen = tuple(
+            tuple(sorted(episode.items())) for episode in episodes_data
+        )
+        return _render_mock_rss(frozen, title)
 
     def create_test_podcast(self, **kwargs: Any) -> Podcast:
         """Create a test Podcast object with sensible defaults."""
@@ -8,6 +8,7 @@ from unittest.mock import Mock, patch
 
 from easy_podcast.factory import create_manager_from_rss
 from easy_podcast.models import EpisodeFile, Podcast
+from easy_podcast.repository import PodcastRepository
 
 from tests.base import PodcastTestBase
 from tests.utils import create_test_episode
@@ -45,13 +46,11 @@ class TestPodcastManagerEpisodes(PodcastTestBase):
         test_podcast_dir = self.test_dir
         manager = self.create_manager(test_podcast, test_podcast_dir)
 
-        expected_path = manager.get_episode_file_path(
-            episode, EpisodeFile.AUDIO
+        # Episode files live directly in the podcast directory
+        self.assertEqual(
+            manager.get_episode_file_path(episode, EpisodeFile.AUDIO),
+            os.path.join(self.test_dir, test_podcast.guid, "test123.mp3"),
         )
-        # Check they match
-        actual_path = manager.get_episode_file_path(episode, EpisodeFile.AUDIO)
-
-        self.assertEqual(actual_path, expected_path)
 
     def test_episode_audio_exists(self) -> None:
         """Test episode_audio_exists method."""
@@ -78,9 +77,7 @@ class TestPodcastManagerEpisodes(PodcastTestBase):
         episode_path = manager.get_episode_file_path(
             episode, EpisodeFile.AUDIO
         )
-        os.makedirs(os.path.dirname(episode_path), exist_ok=True)
-        with open(episode_path, "w", encoding="utf-8") as f:
-            f.write("test content")
+        self._touch(episode_path, b"test content")
 
         # File should exist now
         self.assertTrue(
@@ -103,14 +100,56 @@ class TestPodcastManagerEpisodes(PodcastTestBase):
         test_podcast_dir = self.test_dir
         manager = self.create_manager(test_podcast, test_podcast_dir)
 
-        expected_path = manager.get_episode_file_path(
-            episode, EpisodeFile.TRANSCRIPT
+        self.assertEqual(
+            manager.get_episode_file_path(episode, EpisodeFile.TRANSCRIPT),
+            os.path.join(
+                self.test_dir, test_podcast.guid, "test789_transcript.json"
+            ),
         )
-        actual_path = manager.get_episode_file_path(
-            episode, EpisodeFile.TRANSCRIPT
+
+    def test_episode_file_path_is_cached(self) -> None:
+        """Test repeated path lookups are served from the manager cache."""
+        episode = create_test_episode(id="test202")
+        manager = self.create_manager(
+            self.create_test_podcast(episodes=[episode])
         )
 
-        self.assertEqual(actual_path, expected_path)
+        with patch.object(
+            PodcastRepository,
+            "get_episode_file_path",
+            autospec=True,
+            side_effect=PodcastRepository.get_episode_file_path,
+        ) as mock_path:
+            audio_path = manager.get_episode_file_path(
+                episode, EpisodeFile.AUDIO
+            )
+            self.assertEqual(
+                manager.get_episode_file_path(episode, EpisodeFile.AUDIO),
+                audio_path,
+            )
+
+        self.assertEqual(mock_path.call_count, 1)
+        self.assertNotEqual(
+            manager.get_episode_file_path(episode, EpisodeFile.TRANSCRIPT),
+            audio_path,
+        )
+
+    def test_episode_file_path_follows_podcast_change(self) -> None:
+        """Test cached paths are not reused after the podcast is replaced."""
+        episode = create_test_episode(id="test203")
+        manager = self.create_manager(
+            self.create_test_podcast(episodes=[episode], guid="old")
+        )
+        manager.get_episode_file_path(episode, EpisodeFile.AUDIO)
+
+        manager.podcast = self.create_test_podcast(
+            episodes=[episode], guid="new"
+        )
+
+        self.assertEqual(
+            manager.get_episode_file_path(episode, EpisodeFile.AUDIO),
+            os.path.join(self.test_dir, "new", "test203.mp3"),
+        )
 
     def test_episode_transcript_exists(self) -> None:
         """Test episode_transcript_exists method."""
@@ -139,9 +178,7 @@ class TestPodcastManagerEpisodes(PodcastTestBase):
         transcript_path = manager.get_episode_file_path(
             episode, EpisodeFile.TRANSCRIPT
         )
-        os.makedirs(os.path.dirname(transcript_path), exist_ok=True)
-        with open(transcript_path, "w", encoding="utf-8") as f:
-            f.write('{"test": "transcript content"}')
+        self._touch(transcript_path, b'{"test": "transcript content"}')
 
         # File should exist now
         self.assertTrue(
@@ -217,9 +254,7 @@ class TestPodcastManagerEpisodes(PodcastTestBase):
         for ep in new_episodes:
             # Create dummy audio files to simulate download
             episode_path = manager.get_episode_file_path(ep, EpisodeFile.AUDIO)
-            os.makedirs(os.path.dirname(episode_path), exist_ok=True)
-            with open(episode_path, "w", encoding="utf-8") as f:
-                f.write("dummy content")
+            self._touch(episode_path)
             # No need to save episode metadata since episodes are already saved
 
         # Second ingestion: one new episode, one old
@@ -293,9 +328,7 @@ class TestPodcastManagerEpisodes(PodcastTestBase):
             episode_path = manager.get_episode_file_path(
                 episode, EpisodeFile.AUDIO
             )
-            os.makedirs(os.path.dirname(episode_path), exist_ok=True)
-            with open(episode_path, "w", encoding="utf-8") as f:
-                f.write("dummy content")
+            self._touch(episode_path)
             manager.podcast.episodes.append(episode)
             manager.repository.save_episodes(
                 manager.podcast.title, manager.podcast.episodes
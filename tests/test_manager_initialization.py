@@ -23,6 +23,41 @@ from tests.base import PodcastTestBase
 class TestPodcastManagerInitialization(PodcastTestBase):
     """Test suite for PodcastManager initialization and factory methods."""
 
+    # RSS bytes served by the patched requests.get, keyed by URL
+    _rss_responses: Dict[str, bytes] = {}
+    _storage: Storage
+    _repository: PodcastRepository
+    _downloader: EpisodeDownloader
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Patch requests.get once with a URL-to-content dispatcher."""
+        super().setUpClass()
+        # Storage adapters are stateless apart from caches, so one set
+        # rooted at the class directory serves every test
+        cls._storage = Storage(cls._root)
+        cls._repository = PodcastRepository(cls._storage)
+        cls._downloader = EpisodeDownloader(cls._storage)
+
+        patcher = patch("requests.get", side_effect=cls._fake_get)
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+    @classmethod
+    def _fake_get(cls, url: str, **_kwargs: Any) -> Mock:
+        """Serve registered RSS content, failing like a dead host."""
+        if url not in cls._rss_responses:
+            raise requests.exceptions.ConnectionError("Network error")
+        response = Mock()
+        response.content = cls._rss_responses[url]
+        response.raise_for_status.return_value = None
+        return response
+
+    def setUp(self) -> None:
+        """Start each test with no RSS feeds registered."""
+        super().setUp()
+        self._rss_responses.clear()
+
     def test_manager_initialization(self) -> None:
         """Test PodcastManager initialization with dependency injection."""
         # Create a simple podcast object for testing
@@ -32,13 +67,10 @@ class TestPodcastManagerInitialization(PodcastTestBase):
             episodes=[],
         )
 
-        # Create dependencies
-        storage = Storage(self.test_dir)
-        repository = PodcastRepository(storage)
-        downloader = EpisodeDownloader(storage)
-
         # Create manager with dependency injection
-        manager = PodcastManager(test_podcast, repository, downloader)
+        manager = PodcastManager(
+            test_podcast, self._repository, self._downloader
+        )
 
         # Verify manager properties
         self.assertIsNotNone(manager.podcast)
@@ -62,20 +94,15 @@ class TestPodcastManagerInitialization(PodcastTestBase):
             episodes_data, title="Test Podcast from Storage"
         )
 
-        # Mock the RSS response
-        with patch("requests.get") as mock_get:
-            mock_response = Mock()
-            mock_response.content = rss_content
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
+        self._rss_responses["http://test.com/rss"] = rss_content
 
-            # Create the initial manager to set up storage
-            initial_manager = create_manager_from_rss(
-                "http://test.com/rss", self.test_dir
-            )
-            self.assertIsNotNone(initial_manager)
-            assert initial_manager is not None  # Type hint for mypy
-            podcast_guid = initial_manager.podcast.guid
+        # Create the initial manager to set up storage
+        initial_manager = create_manager_from_rss(
+            "http://test.com/rss", self.test_dir
+        )
+        self.assertIsNotNone(initial_manager)
+        assert initial_manager is not None  # Type hint for mypy
+        podcast_guid = initial_manager.podcast.guid
 
         # Now test loading from existing storage
         manager = create_manager_from_storage(podcast_guid, self.test_dir)
@@ -137,18 +164,14 @@ class TestPodcastManagerInitialization(PodcastTestBase):
         # Create a manager with no episodes first
         rss_content = self.create_mock_rss_content([], title="Empty Podcast")
 
-        with patch("requests.get") as mock_get:
-            mock_response = Mock()
-            mock_response.content = rss_content
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
+        self._rss_responses["http://test.com/empty_rss"] = rss_content
 
-            initial_manager = create_manager_from_rss(
-                "http://test.com/empty_rss", self.test_dir
-            )
-            self.assertIsNotNone(initial_manager)
-            assert initial_manager is not None
-            podcast_guid = initial_manager.podcast.guid
+        initial_manager = create_manager_from_rss(
+            "http://test.com/empty_rss", self.test_dir
+        )
+        self.assertIsNotNone(initial_manager)
+        assert initial_manager is not None
+        podcast_guid = initial_manager.podcast.guid
 
         # Now test loading from existing storage
         manager = create_manager_from_storage(podcast_guid, self.test_dir)
@@ -167,8 +190,7 @@ class TestPodcastManagerInitialization(PodcastTestBase):
                 len(manager.podcast.episodes), 0, "Should have no episodes"
             )
 
-    @patch("requests.get")
-    def test_from_rss_url_success(self, mock_get: Mock) -> None:
+    def test_from_rss_url_success(self) -> None:
         """Test successful creation from RSS URL."""
         episodes_data: List[Dict[str, Any]] = [
             {
@@ -182,10 +204,7 @@ class TestPodcastManagerInitialization(PodcastTestBase):
             episodes_data, title="Test Podcast from RSS"
         )
 
-        mock_response = Mock()
-        mock_response.content = rss_content
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        self._rss_responses["http://test.com/rss"] = rss_content
 
         manager = create_manager_from_rss("http://test.com/rss", self.test_dir)
 
@@ -195,14 +214,9 @@ class TestPodcastManagerInitialization(PodcastTestBase):
             self.assertEqual(len(manager.podcast.episodes), 1)
             self.assertEqual(manager.podcast.episodes[0].id, "123")
 
-    @patch("requests.get")
-    def test_from_rss_url_download_failure(self, mock_get: Mock) -> None:
+    def test_from_rss_url_download_failure(self) -> None:
         """Test from_rss_url when RSS download fails."""
-
-        mock_get.side_effect = requests.exceptions.ConnectionError(
-            "Network error"
-        )
-
+        # No feed is registered, so the patched requests.get fails
         manager = create_manager_from_rss("http://test.com/rss", self.test_dir)
 
         self.assertIsNone(manager)
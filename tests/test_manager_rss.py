@@ -2,199 +2,114 @@
 Tests for PodcastManager RSS handling functionality.
 """
 
-import os
-from typing import Any, Dict, List
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from easy_podcast.factory import create_manager_from_rss
-from easy_podcast.models import Podcast
+from easy_podcast.repository import PodcastRepository
 
 from tests.base import PodcastTestBase
-from tests.utils import create_test_episode
+from tests.utils import (
+    EMPTY_PODCAST,
+    SAMPLE_PODCAST,
+    SPECIAL_CHARS_PODCAST,
+    UNKNOWN_TITLE_PODCAST,
+)
 
 
 class TestPodcastManagerRSS(PodcastTestBase):
     """Test suite for PodcastManager RSS handling functionality."""
 
-    @patch("easy_podcast.factory.PodcastParser.from_content")
-    @patch("easy_podcast.factory.download_rss_from_url")
-    def test_ingest_rss_data_success(
-        self, mock_download_rss: Mock, mock_parse_content: Mock
-    ) -> None:
-        """Test successful RSS ingestion using static method."""
-        # Create mock RSS content
-        episodes_data: List[Dict[str, Any]] = [
-            {
-                "supercast_episode_id": "123",
-                "title": "Test Episode",
-                "audio_link": "http://test.com/test.mp3",
-                "size": 1000,
-            }
-        ]
-        mock_rss_content = self.create_mock_rss_content(
-            episodes_data, "Test Podcast"
-        )
-        mock_download_rss.return_value = mock_rss_content
-
-        # Create mock podcast
-        mock_episode = create_test_episode(
-            id="123",
-            title="Test Episode",
-            size=1000,
-            audio_link="http://test.com/test.mp3",
-        )
-        mock_podcast = Podcast(
-            title="Test Podcast",
-            rss_url="http://test.com/rss",
-            episodes=[mock_episode],
-        )
-        mock_parse_content.return_value = mock_podcast
-
-        manager = create_manager_from_rss("http://test.com/rss", self.test_dir)
-
-        self.assertIsNotNone(manager)
-        if manager:
-            podcast = manager.get_podcast()
-            self.assertEqual(podcast.title, "Test Podcast")
-            self.assertEqual(len(podcast.episodes), 1)
-
-            # Check that podcast directory exists
-            podcast_dir = manager.get_podcast_data_dir()
-            self.assertTrue(os.path.exists(podcast_dir))
-
-    @patch("easy_podcast.factory.download_rss_from_url")
-    def test_ingest_rss_data_failure(self, mock_download_rss: Mock) -> None:
-        """Test RSS ingestion failure using static method."""
-        mock_download_rss.return_value = None
-
-        manager = create_manager_from_rss("http://test.com/rss", self.test_dir)
-
-        self.assertIsNone(manager)
+    # The parser is patched, so the downloaded bytes are never parsed
+    _DUMMY_RSS = b"<rss/>"
 
-    @patch("easy_podcast.factory.PodcastParser.from_content")
-    @patch("easy_podcast.factory.download_rss_from_url")
-    def test_empty_rss_feed(
-        self, mock_download_rss: Mock, mock_parse_content: Mock
-    ) -> None:
-        """Test handling of empty RSS feed using static method."""
-        # Create mock RSS content for empty feed
-        mock_rss_content = self.create_mock_rss_content([], "Empty Podcast")
-        mock_download_rss.return_value = mock_rss_content
-
-        # Create mock podcast with no episodes
-        mock_podcast = Podcast(
-            title="Empty Podcast",
-            rss_url="http://test.com/rss",
-            episodes=[],
-        )
-        mock_parse_content.return_value = mock_podcast
-
-        manager = create_manager_from_rss("http://test.com/rss", self.test_dir)
+    mock_download_rss: Mock
+    mock_parse_content: Mock
 
-        self.assertIsNotNone(manager)
-        if manager:
-            podcast = manager.get_podcast()
-            self.assertEqual(len(podcast.episodes), 0)
-            self.assertEqual(len(manager.get_new_episodes()), 0)
-
-    @patch("easy_podcast.factory.PodcastParser.from_content")
-    @patch("easy_podcast.factory.download_rss_from_url")
-    def test_rss_feed_missing_title(
-        self, mock_download_rss: Mock, mock_parse_content: Mock
-    ) -> None:
-        """Test handling of RSS feed without title using static method."""
-        # Create mock RSS content
-        mock_rss_content = self.create_mock_rss_content([], "Unknown Podcast")
-        mock_download_rss.return_value = mock_rss_content
-
-        # Create a podcast with default title
-        mock_podcast = Podcast(
-            title="Unknown Podcast",
-            rss_url="http://test.com/rss",
-            episodes=[],
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Patch the factory's RSS download and parser for the class."""
+        super().setUpClass()
+        # Plain Mocks record calls without MagicMock's magic-method setup
+        download_patcher = patch(
+            "easy_podcast.factory.download_rss_from_url", new_callable=Mock
         )
-        mock_parse_content.return_value = mock_podcast
+        cls.mock_download_rss = download_patcher.start()
+        cls.addClassCleanup(download_patcher.stop)
 
-        manager = create_manager_from_rss("http://test.com/rss", self.test_dir)
-
-        self.assertIsNotNone(manager)
-        if manager:
-            podcast = manager.get_podcast()
-            self.assertEqual(podcast.title, "Unknown Podcast")
-
-        mock_download_rss.assert_called_once_with("http://test.com/rss")
-
-    @patch("easy_podcast.factory.PodcastParser.from_content")
-    @patch("easy_podcast.factory.download_rss_from_url")
-    def test_sanitized_podcast_title(
-        self, mock_download_rss: Mock, mock_parse_content: Mock
-    ) -> None:
-        """Test that podcast titles with special characters are sanitized."""
-        # Create mock RSS content
-        mock_rss_content = self.create_mock_rss_content(
-            [], "Test/Podcast\\With:Special*Chars"
+        parse_patcher = patch(
+            "easy_podcast.factory.PodcastParser.from_content",
+            new_callable=Mock,
         )
-        mock_download_rss.return_value = mock_rss_content
-
-        # Create a podcast with the special characters title
-        mock_podcast = Podcast(
-            title="Test/Podcast\\With:Special*Chars",
-            rss_url="http://test.com/rss",
-            episodes=[],
+        cls.mock_parse_content = parse_patcher.start()
+        cls.addClassCleanup(parse_patcher.stop)
+
+    def setUp(self) -> None:
+        """Clear calls and configuration left by the previous test."""
+        super().setUp()
+        for mock in (self.mock_download_rss, self.mock_parse_content):
+            mock.reset_mock(return_value=True, side_effect=True)
+
+    @staticmethod
+    def _mock_repository() -> MagicMock:
+        """Create a repository stand-in that never touches the disk."""
+        repository = MagicMock(spec=PodcastRepository)
+        repository.commit_podcast.return_value = True
+        # No episode files exist behind the mock
+        repository.filter_new_episodes.side_effect = (
+            lambda _guid, episodes: list(episodes)
         )
-        mock_parse_content.return_value = mock_podcast
-
-        manager = create_manager_from_rss("http://test.com/rss", self.test_dir)
-
-        self.assertIsNotNone(manager)
-        # Check that the directory path was created successfully
-        if manager:
-            # Check that podcast directory exists
-            podcast_dir = manager.get_podcast_data_dir()
-            self.assertTrue(os.path.exists(podcast_dir))
-
-    @patch("easy_podcast.factory.PodcastParser.from_content")
-    @patch("easy_podcast.factory.download_rss_from_url")
-    def test_rss_content_saved_to_file(
-        self, mock_download_rss: Mock, mock_parse_content: Mock
-    ) -> None:
-        """Test that manager is created correctly from RSS URL."""
-        # Create mock RSS content
-        episodes_data: List[Dict[str, Any]] = [
-            {
-                "supercast_episode_id": "123",
-                "title": "Test Episode",
-                "audio_link": "http://test.com/test.mp3",
-                "size": 1000,
-            }
+        return repository
+
+    def test_ingest_rss_data(self) -> None:
+        """Test manager creation from RSS for several feed shapes."""
+        # The factory only reads the parsed podcast, so the shared module
+        # fixtures can be handed out as parser return values
+        cases = [
+            ("with_episode", SAMPLE_PODCAST),
+            ("empty", EMPTY_PODCAST),
+            ("missing_title", UNKNOWN_TITLE_PODCAST),
+            ("special_chars", SPECIAL_CHARS_PODCAST),
         ]
-        mock_rss_content = self.create_mock_rss_content(
-            episodes_data, "Test Podcast"
-        )
-        mock_download_rss.return_value = mock_rss_content
-
-        # Create mock podcast
-        mock_episode = create_test_episode(
-            id="123",
-            published="2023-01-01",
-            title="Test Episode",
-            author="Test",
-            duration_seconds=1800,
-            size=1000,
-            audio_link="http://test.com/test.mp3",
-        )
-        mock_podcast = Podcast(
-            title="Test Podcast",
-            rss_url="http://test.com/rss",
-            episodes=[mock_episode],
-        )
-        mock_parse_content.return_value = mock_podcast
+        mock_download_rss = self.mock_download_rss
+        mock_download_rss.return_value = self._DUMMY_RSS
+
+        for name, parsed_podcast in cases:
+            with self.subTest(name=name):
+                mock_download_rss.reset_mock()
+                self.mock_parse_content.return_value = parsed_podcast
+                repository = self._mock_repository()
+
+                manager = create_manager_from_rss(
+                    "http://test.com/rss", repository=repository
+                )
+
+                self.assertIsNotNone(manager)
+                assert manager is not None  # For type checker
+                podcast = manager.get_podcast()
+                self.assertEqual(podcast.title, parsed_podcast.title)
+                self.assertEqual(
+                    len(podcast.episodes), len(parsed_podcast.episodes)
+                )
+                # Nothing is downloaded yet, so every episode is new
+                self.assertEqual(
+                    len(manager.get_new_episodes()), len(podcast.episodes)
+                )
+
+                mock_download_rss.assert_called_once_with(
+                    "http://test.com/rss"
+                )
+                repository.commit_podcast.assert_called_once_with(
+                    parsed_podcast, self._DUMMY_RSS
+                )
+                repository.ensure_podcast_dir_exists.assert_called_once_with(
+                    podcast.guid
+                )
+
+    def test_ingest_rss_data_failure(self) -> None:
+        """Test RSS ingestion failure using static method."""
+        self.mock_download_rss.return_value = None
 
         manager = create_manager_from_rss("http://test.com/rss", self.test_dir)
 
-        # Verify manager was created
-        self.assertIsNotNone(manager)
-        if manager:
-            podcast = manager.get_podcast()
-            self.assertEqual(podcast.title, "Test Podcast")
-            self.assertEqual(len(podcast.episodes), 1)
+        self.assertIsNone(manager)
+        self.mock_parse_content.assert_not_called()
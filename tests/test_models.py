@@ -3,9 +3,10 @@ Tests for data models (Episode and Podcast classes).
 """
 
 import unittest
-from typing import Any, Dict
+from dataclasses import FrozenInstanceError
+from typing import Any, Dict, List
 
-from easy_podcast.models import Episode, Podcast
+from easy_podcast.models import Episode, Podcast, Storable
 
 from tests.utils import create_test_episode
 
@@ -51,6 +52,23 @@ class TestEpisode(unittest.TestCase):
         self.assertEqual(data_dict["size"], 1000)
         self.assertEqual(data_dict["author"], "Test Author")
 
+    def test_models_satisfy_storable(self) -> None:
+        """Test frozen models still conform to the Storable protocol."""
+        # The annotation makes mypy check protocol conformance as well
+        entities: List[Storable] = [
+            create_test_episode(id="123", guid="ep-guid"),
+            Podcast(title="Test", rss_url="http://test.com/rss", guid="pc"),
+        ]
+
+        self.assertEqual([e.guid for e in entities], ["ep-guid", "pc"])
+
+    def test_episode_is_immutable(self) -> None:
+        """Test that Episode fields cannot be reassigned."""
+        episode = create_test_episode(id="123")
+
+        with self.assertRaises(FrozenInstanceError):
+            episode.title = "Changed"  # type: ignore[misc]
+
 
 class TestPodcast(unittest.TestCase):
     """Test suite for the Podcast class."""
@@ -144,6 +162,24 @@ class TestPodcast(unittest.TestCase):
         self.assertEqual(restored_podcast.guid, "test-podcast-guid")
         self.assertEqual(len(restored_podcast.episodes), 0)
 
+    def test_podcast_metadata_to_json_omits_episodes(self) -> None:
+        """Test Podcast metadata_to_json leaves out the episode list."""
+        podcast = Podcast(
+            title="Test Podcast",
+            rss_url="http://test.com/rss",
+            episodes=[create_test_episode(id="123")],
+            guid="test-podcast-guid",
+        )
+
+        self.assertEqual(
+            podcast.metadata_to_json(),
+            {
+                "title": "Test Podcast",
+                "rss_url": "http://test.com/rss",
+                "guid": "test-podcast-guid",
+            },
+        )
+
     def test_podcast_serialization_with_episodes(self) -> None:
         """Test Podcast serialization with episodes."""
         episode = create_test_episode(
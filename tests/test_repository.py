@@ -0,0 +1,162 @@
+"""
+Tests for PodcastRepository persistence helpers.
+"""
+
+import asyncio
+import os
+from unittest.mock import patch
+
+from easy_podcast.models import EpisodeFile
+from easy_podcast.repository import PodcastRepository
+from easy_podcast.storage import Storage
+
+from tests.base import PodcastTestBase
+from tests.utils import create_test_episode
+
+
+class TestPodcastRepository(PodcastTestBase):
+    """Test suite for PodcastRepository."""
+
+    def setUp(self) -> None:
+        """Create a repository rooted in the test directory."""
+        super().setUp()
+        self.repository = PodcastRepository(Storage(self.test_dir))
+
+    def test_rss_cache_async_round_trip(self) -> None:
+        """Test async RSS cache save/load matches the sync methods."""
+        rss_content = self.get_wellformed_xml()
+
+        saved = asyncio.run(
+            self.repository.save_rss_cache_async("guid1", rss_content)
+        )
+
+        self.assertTrue(saved)
+        self.assertEqual(self.repository.load_rss_cache("guid1"), rss_content)
+
+    def test_load_rss_cache_async_concurrent(self) -> None:
+        """Test loading several RSS caches concurrently."""
+        self.repository.save_rss_cache("guid1", b"<rss>1</rss>")
+        self.repository.save_rss_cache("guid2", b"<rss>2</rss>")
+
+        async def load_all() -> list[bytes | None]:
+            return list(
+                await asyncio.gather(
+                    self.repository.load_rss_cache_async("guid1"),
+                    self.repository.load_rss_cache_async("guid2"),
+                    self.repository.load_rss_cache_async("missing"),
+                )
+            )
+
+        self.assertEqual(
+            asyncio.run(load_all()), [b"<rss>1</rss>", b"<rss>2</rss>", None]
+        )
+
+    def test_upsert_episodes_appends_only_new(self) -> None:
+        """Test upsert keeps existing lines and appends new episodes."""
+        first = create_test_episode(id="1", guid="g1")
+        second = create_test_episode(id="2", guid="g2")
+        self.repository.save_episodes("guid1", [first])
+
+        all_episodes, newly_added = self.repository.upsert_episodes(
+            "guid1", [first, second]
+        )
+
+        self.assertEqual([e.id for e in all_episodes], ["1", "2"])
+        self.assertEqual([e.id for e in newly_added], ["2"])
+        self.assertEqual(
+            [e.id for e in self.repository.load_episodes("guid1")],
+            ["1", "2"],
+        )
+
+    def test_upsert_episodes_without_new_leaves_file_untouched(self) -> None:
+        """Test upsert with only known episodes does not write."""
+        episode = create_test_episode(id="1", guid="g1")
+        self.repository.save_episodes("guid1", [episode])
+        episodes_path = os.path.join(
+            self.repository.get_podcast_dir("guid1"), "episodes.jsonl"
+        )
+        mtime = os.stat(episodes_path).st_mtime_ns
+
+        _, newly_added = self.repository.upsert_episodes("guid1", [episode])
+
+        self.assertEqual(newly_added, [])
+        self.assertEqual(os.stat(episodes_path).st_mtime_ns, mtime)
+
+    def test_load_episodes_uses_cache_until_file_changes(self) -> None:
+        """Test repeated loads reuse parsed episodes until a write."""
+        self.repository.save_episodes("guid1", [create_test_episode(id="1")])
+
+        with patch.object(
+            self.repository.episode_repository,
+            "load",
+            wraps=self.repository.episode_repository.load,
+        ) as mock_load:
+            first = self.repository.load_episodes("guid1")
+            second = self.repository.load_episodes("guid1")
+            self.assertEqual(mock_load.call_count, 1)
+
+            self.repository.save_episodes(
+                "guid1",
+                [create_test_episode(id="1"), create_test_episode(id="2")],
+            )
+            third = self.repository.load_episodes("guid1")
+            self.assertEqual(mock_load.call_count, 2)
+
+        self.assertEqual([e.id for e in first], ["1"])
+        self.assertIsNot(first, second)
+        self.assertEqual([e.id for e in third], ["1", "2"])
+
+    def test_commit_podcast_saves_all_files(self) -> None:
+        """Test commit_podcast writes metadata, episodes and RSS cache."""
+        podcast = self.create_test_podcast(
+            guid="guid1", episodes=[create_test_episode(id="1")]
+        )
+
+        with patch.object(
+            self.repository.storage,
+            "sync_directory",
+            wraps=self.repository.storage.sync_directory,
+        ) as mock_sync:
+            self.assertTrue(self.repository.commit_podcast(podcast, b"<rss/>"))
+
+        self.assertEqual(mock_sync.call_count, 2)
+        loaded = self.repository.load_podcast_metadata("guid1")
+        self.assertIsNotNone(loaded)
+        assert loaded is not None  # For type checker
+        self.assertEqual(loaded.title, "Test Podcast")
+        self.assertEqual(
+            [e.id for e in self.repository.load_episodes("guid1")], ["1"]
+        )
+        self.assertEqual(self.repository.load_rss_cache("guid1"), b"<rss/>")
+
+    def test_filter_new_episodes_lists_directory_once(self) -> None:
+        """Test downloaded episodes are matched from one directory listing."""
+        episodes = [create_test_episode(id=str(i)) for i in range(1, 4)]
+        podcast_dir = self.repository.ensure_podcast_dir_exists("guid1")
+        with open(os.path.join(podcast_dir, "1.mp3"), "wb"):
+            pass
+        # A directory with an audio file name is not a download
+        os.mkdir(os.path.join(podcast_dir, "2.mp3"))
+
+        with patch.object(
+            self.repository.storage,
+            "list_files",
+            wraps=self.repository.storage.list_files,
+        ) as mock_list:
+            new_episodes = self.repository.filter_new_episodes(
+                "guid1", episodes
+            )
+
+        mock_list.assert_called_once_with(podcast_dir)
+        self.assertEqual([e.id for e in new_episodes], ["2", "3"])
+        # Per-episode checks apply the same rule as the listing
+        self.assertEqual(
+            [
+                e.id
+                for e in episodes
+                if not self.repository.episode_file_exists(
+                    "guid1", e, EpisodeFile.AUDIO
+                )
+            ],
+            ["2", "3"],
+        )
@@ -0,0 +1,160 @@
+"""
+Tests for the Storage file layer.
+"""
+
+import os
+import shutil
+from typing import Iterator
+from unittest.mock import patch
+
+from easy_podcast.storage import Storage
+
+from tests.base import PodcastTestBase
+
+
+class TestStorage(PodcastTestBase):
+    """Test suite for Storage file operations."""
+
+    def setUp(self) -> None:
+        """Create a storage rooted in the test directory."""
+        super().setUp()
+        self.storage = Storage(self.test_dir)
+
+    def test_write_json_failure_keeps_previous_file(self) -> None:
+        """Test a failed JSON write leaves the old file and no temp file."""
+        path = os.path.join(self.test_dir, "podcast", "podcast.json")
+        self.assertTrue(self.storage.write_json(path, {"title": "Old"}))
+
+        self.assertFalse(self.storage.write_json(path, {"bad": object()}))
+
+        self.assertEqual(self.storage.read_json(path), {"title": "Old"})
+        self.assertEqual(os.listdir(os.path.dirname(path)), ["podcast.json"])
+
+    def test_write_jsonl_failure_keeps_previous_file(self) -> None:
+        """Test an interrupted record stream does not truncate the file."""
+        path = os.path.join(self.test_dir, "episodes.jsonl")
+        self.assertTrue(self.storage.write_jsonl(path, ["a", "b"]))
+
+        def failing_records() -> Iterator[str]:
+            yield "c"
+            raise IOError("stream failed")
+
+        self.assertFalse(self.storage.write_jsonl(path, failing_records()))
+        self.assertEqual(self.storage.read_jsonl(path), ["a", "b"])
+        self.assertEqual(os.listdir(self.test_dir), ["episodes.jsonl"])
+
+    def test_overlapping_writes_use_separate_temp_files(self) -> None:
+        """Test a write started mid-stream cannot corrupt the outer one."""
+        path = os.path.join(self.test_dir, "episodes.jsonl")
+
+        def records() -> Iterator[str]:
+            yield "outer"
+            self.assertTrue(self.storage.write_jsonl(path, ["inner"]))
+            yield "done"
+
+        self.assertTrue(self.storage.write_jsonl(path, records()))
+        self.assertEqual(self.storage.read_jsonl(path), ["outer", "done"])
+        self.assertEqual(os.listdir(self.test_dir), ["episodes.jsonl"])
+
+    def test_written_files_respect_umask(self) -> None:
+        """Test replaced files get the mode open() would give them."""
+        umask = os.umask(0)
+        os.umask(umask)
+        path = os.path.join(self.test_dir, "podcast.json")
+
+        self.assertTrue(self.storage.write_json(path, {"title": "Test"}))
+
+        self.assertEqual(os.stat(path).st_mode & 0o777, 0o666 & ~umask)
+
+    def test_write_to_bare_relative_path(self) -> None:
+        """Test the temp file for a bare file name stays in the cwd."""
+        cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        self.addCleanup(os.chdir, cwd)
+
+        with patch(
+            "easy_podcast.storage.os.replace", wraps=os.replace
+        ) as mock_replace:
+            self.assertTrue(Storage(".").write_json("x.json", {"a": 1}))
+
+        tmp_path = mock_replace.call_args.args[0]
+        self.assertTrue(os.path.samefile(os.path.dirname(tmp_path), os.curdir))
+        self.assertEqual(os.listdir(self.test_dir), ["x.json"])
+
+    def test_writes_create_parent_directory_once(self) -> None:
+        """Test repeated writes into one directory run makedirs once."""
+        directory = os.path.join(self.test_dir, "podcast")
+
+        with patch(
+            "easy_podcast.storage.os.makedirs", wraps=os.makedirs
+        ) as mock_makedirs:
+            self.storage.write_bytes(os.path.join(directory, "a"), b"a")
+            self.storage.write_bytes(os.path.join(directory, "b"), b"b")
+
+        mock_makedirs.assert_called_once_with(directory, exist_ok=True)
+
+    def test_ensure_directory_recreates_removed_directory(self) -> None:
+        """Test ensure_directory always leaves the directory in place."""
+        path = os.path.join(self.test_dir, "podcast")
+        self.storage.ensure_directory(path)
+        shutil.rmtree(path)
+
+        self.storage.ensure_directory(path)
+
+        self.assertTrue(os.path.isdir(path))
+
+    def test_write_recreates_removed_directory(self) -> None:
+        """Test writes still succeed if a remembered directory is deleted."""
+        directory = os.path.join(self.test_dir, "podcast")
+        path = os.path.join(directory, "podcast.json")
+        self.assertTrue(self.storage.write_json(path, {"title": "One"}))
+
+        shutil.rmtree(directory)
+
+        self.assertTrue(self.storage.write_json(path, {"title": "Two"}))
+        self.assertEqual(self.storage.read_json(path), {"title": "Two"})
+
+        shutil.rmtree(directory)
+        self.assertTrue(
+            self.storage.append_jsonl(
+                os.path.join(directory, "episodes.jsonl"), [{}]
+            )
+        )
+
+    def test_read_json_invalid_content_returns_none(self) -> None:
+        """Test malformed JSON, invalid UTF-8 and non-dict JSON."""
+        path = os.path.join(self.test_dir, "podcast.json")
+        for content in (b"{not json", b"\xff\xfe{}", b"[1, 2]"):
+            with self.subTest(content=content):
+                with open(path, "wb") as f:
+                    f.write(content)
+                self.assertIsNone(self.storage.read_json(path))
+
+    def test_jsonl_round_trip_is_compact(self) -> None:
+        """Test JSONL writes compact lines and reads skip bad lines."""
+        path = os.path.join(self.test_dir, "podcast", "episodes.jsonl")
+        self.assertTrue(self.storage.write_jsonl(path, [{"id": "1"}]))
+        self.assertTrue(self.storage.append_jsonl(path, [{"id": "é"}]))
+        with open(path, "ab") as f:
+            f.write(b"\n{not json\n")
+
+        with open(path, "rb") as f:
+            self.assertEqual(
+                f.read().splitlines()[:2],
+                [b'{"id":"1"}', '{"id":"é"}'.encode("utf-8")],
+            )
+        self.assertEqual(
+            self.storage.read_jsonl(path), [{"id": "1"}, {"id": "é"}]
+        )
+
+    def test_append_jsonl_after_partial_line(self) -> None:
+        """Test an append after an interrupted one keeps the new record."""
+        path = os.path.join(self.test_dir, "episodes.jsonl")
+        with open(path, "wb") as f:
+            f.write(b'{"id":"1"}\n{"id":')
+
+        self.assertTrue(self.storage.append_jsonl(path, [{"id": "2"}]))
+
+        self.assertEqual(
+            self.storage.read_jsonl(path), [{"id": "1"}, {"id": "2"}]
+        )
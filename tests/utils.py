@@ -5,10 +5,11 @@ This module contains shared test utilities that are used across
 multiple test files to reduce code duplication and maintain consistency.
 """
 
-from typing import Any, Dict, List, Optional
+import functools
+from typing import Any, Dict, List, Optional, Tuple
 from unittest.mock import Mock
 
-from easy_podcast.models import Episode
+from easy_podcast.models import Episode, Podcast
 
 
 def create_test_episode(**kwargs: Any) -> Episode:
@@ -31,7 +32,16 @@ def create_test_episode(**kwargs: Any) -> Episode:
 
         # Create episode with custom ID and title
         episode = create_test_episode(id="123", title="Custom Title")
+
+    Identical calls return the same cached Episode, which is safe to share
+    because Episode is frozen.
     """
+    return _build_test_episode(tuple(sorted(kwargs.items())))
+
+
+@functools.lru_cache(maxsize=256)
+def _build_test_episode(overrides: Tuple[Tuple[str, Any], ...]) -> Episode:
+    """Build an Episode from defaults plus hashable field overrides."""
     defaults: Dict[str, Any] = {
         "id": "test_episode",
         "published": "2023-01-01",
@@ -43,7 +53,7 @@ def create_test_episode(**kwargs: Any) -> Episode:
         "image": "http://example.com/image.jpg",
         "guid": "",  # Default empty GUID like in Episode model
     }
-    defaults.update(kwargs)
+    defaults.update(overrides)
     return Episode(**defaults)
 
 
@@ -81,3 +91,29 @@ class MockTranscriberContext:
         exc_tb: Optional[Any],
     ) -> None:
         pass
+
+
+# Shared parsed-feed fixtures, built once at import. The models are frozen;
+# only the episode lists are mutable, and tests must not extend them.
+SAMPLE_EPISODE = create_test_episode(
+    id="123",
+    title="Test Episode",
+    size=1000,
+    audio_link="http://test.com/test.mp3",
+)
+SAMPLE_PODCAST = Podcast(
+    title="Test Podcast",
+    rss_url="http://test.com/rss",
+    episodes=[SAMPLE_EPISODE],
+)
+EMPTY_PODCAST = Podcast(
+    title="Empty Podcast", rss_url="http://test.com/rss", episodes=[]
+)
+UNKNOWN_TITLE_PODCAST = Podcast(
+    title="Unknown Podcast", rss_url="http://test.com/rss", episodes=[]
+)
+SPECIAL_CHARS_PODCAST = Podcast(
+    title="Test/Podcast\\With:Special*Chars",
+    rss_url="http://test.com/rss",
+    episodes=[],
+)